@@ -5,11 +5,13 @@ A super simple FastAPI application that allows students to view and sign up
 for extracurricular activities at Mergington High School.
 """
 
+from collections.abc import Mapping
+import os
+from pathlib import Path
+
 from fastapi import FastAPI, HTTPException
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import RedirectResponse
-import os
-from pathlib import Path
 
 app = FastAPI(title="Mergington High School API",
               description="API for viewing and signing up for extracurricular activities")
@@ -19,65 +21,86 @@ current_dir = Path(__file__).parent
 app.mount("/static", StaticFiles(directory=os.path.join(Path(__file__).parent,
           "static")), name="static")
 
+
+class ParticipantCounts(Mapping):
+    """Read-only view of the number of participants in each activity"""
+
+    def __init__(self, activities):
+        self._activities = activities
+
+    def __getitem__(self, activity_name):
+        return len(self._activities[activity_name]["participants"])
+
+    def __iter__(self):
+        return iter(self._activities)
+
+    def __len__(self):
+        return len(self._activities)
+
+
 # In-memory activity database
 activities = {
     "Basketball": {
         "description": "Team basketball practice and games",
         "schedule": "Mondays and Wednesdays, 4:00 PM - 5:30 PM",
         "max_participants": 15,
-        "participants": ["alex@mergington.edu"]
+        "participants": {"alex@mergington.edu"}
         },
         "Tennis Club": {
         "description": "Tennis instruction and match play",
         "schedule": "Tuesdays and Thursdays, 3:30 PM - 5:00 PM",
         "max_participants": 10,
-        "participants": ["james@mergington.edu"]
+        "participants": {"james@mergington.edu"}
         },
         "Drama Club": {
         "description": "Theater productions and performance arts",
         "schedule": "Mondays and Thursdays, 4:00 PM - 5:30 PM",
         "max_participants": 25,
-        "participants": ["isabella@mergington.edu", "lucas@mergington.edu"]
+        "participants": {"isabella@mergington.edu", "lucas@mergington.edu"}
         },
         "Art Studio": {
         "description": "Painting, drawing, and visual arts",
         "schedule": "Wednesdays and Fridays, 3:30 PM - 5:00 PM",
         "max_participants": 18,
-        "participants": ["mia@mergington.edu"]
+        "participants": {"mia@mergington.edu"}
         },
         "Debate Team": {
         "description": "Competitive debate and public speaking",
         "schedule": "Tuesdays, 4:00 PM - 5:30 PM",
         "max_participants": 14,
-        "participants": ["noah@mergington.edu", "ava@mergington.edu"]
+        "participants": {"noah@mergington.edu", "ava@mergington.edu"}
         },
         "Robotics Club": {
         "description": "Build and program robots for competitions",
         "schedule": "Thursdays and Saturdays, 3:00 PM - 5:00 PM",
         "max_participants": 16,
-        "participants": ["ethan@mergington.edu"]
+        "participants": {"ethan@mergington.edu"}
         },
     "Chess Club": {
         "description": "Learn strategies and compete in chess tournaments",
         "schedule": "Fridays, 3:30 PM - 5:00 PM",
         "max_participants": 12,
-        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
+        "participants": {"michael@mergington.edu", "daniel@mergington.edu"}
     },
     "Programming Class": {
         "description": "Learn programming fundamentals and build software projects",
         "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
         "max_participants": 20,
-        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
+        "participants": {"emma@mergington.edu", "sophia@mergington.edu"}
     },
     "Gym Class": {
         "description": "Physical education and sports activities",
         "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
         "max_participants": 30,
-        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
+        "participants": {"john@mergington.edu", "olivia@mergington.edu"}
     }
 }
 
 
+# Live counts, so they always match the participant sets
+app.state.participant_counts = ParticipantCounts(activities)
+
+
 @app.get("/")
 def root():
     return RedirectResponse(url="/static/index.html")
@@ -85,7 +108,11 @@ def root():
 
 @app.get("/activities")
 def get_activities():
-    return activities
+    # Participants are stored as sets; return them as sorted lists
+    return {
+        name: {**details, "participants": sorted(details["participants"])}
+        for name, details in activities.items()
+    }
 
 
 @app.post("/activities/{activity_name}/signup")
@@ -103,7 +130,7 @@ def signup_for_activity(activity_name: str, email: str):
         raise HTTPException(status_code=400, detail="Student already signed up for this activity")
 
     # Add student
-    activity["participants"].append(email)
+    activity["participants"].add(email)
     return {"message": f"Signed up {email} for {activity_name}"}
 
 
@@ -122,5 +149,5 @@ def unregister_from_activity(activity_name: str, email: str):
         raise HTTPException(status_code=400, detail="Student is not signed up for this activity")
 
     # Remove student
-    activity["participants"].remove(email)
+    activity["participants"].discard(email)
     return {"message": f"Unregistered {email} from {activity_name}"}
@@ -0,0 +1,55 @@
+"""
+Shared fixtures for the Mergington High School Activities API tests
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import httpx
+import pytest_asyncio
+from app import app, activities
+
+# The only email tests may add or remove; reset_activities undoes nothing else
+TEST_EMAIL = "pytest@mergington.edu"
+
+
+@pytest_asyncio.fixture(scope="session")
+async def client():
+    """Create a single async test client shared by the whole test session"""
+    # ASGITransport does not send lifespan events, so run the app's
+    # startup/shutdown around the session ourselves
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+            yield c
+
+
+@pytest.fixture
+def reset_activities():
+    """Remove TEST_EMAIL from every activity after each test
+
+    Only changes made with TEST_EMAIL are undone. A test that signs up or
+    unregisters any other email leaks that change to later tests on the
+    same worker.
+    """
+    yield
+
+    for activity in activities.values():
+        activity["participants"].discard(TEST_EMAIL)
+
+
+@pytest.fixture
+def test_email(reset_activities):
+    """Email address for tests that change rosters, cleaned up afterwards"""
+    return TEST_EMAIL
+
+
+@pytest.fixture
+def registered_test_email(test_email):
+    """Sign test_email up for Basketball and return it"""
+    activities["Basketball"]["participants"].add(test_email)
+    return test_email
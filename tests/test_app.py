@@ -2,56 +2,43 @@
 Tests for the Mergington High School Activities API
 """
 
+import asyncio
 import pytest
-import sys
-from pathlib import Path
+import pytest_asyncio
+from app import app, activities, signup_for_activity, unregister_from_activity
 
-# Add src directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Pre-encoded endpoint paths; the email is passed separately as a query param
+ACTIVITIES_URL = "/activities"
+BASKETBALL_SIGNUP = "/activities/Basketball/signup"
+BASKETBALL_UNREGISTER = "/activities/Basketball/unregister"
+TENNIS_SIGNUP = "/activities/Tennis%20Club/signup"
+TENNIS_UNREGISTER = "/activities/Tennis%20Club/unregister"
+NONEXISTENT_SIGNUP = "/activities/NonexistentClub/signup"
+NONEXISTENT_UNREGISTER = "/activities/NonexistentClub/unregister"
 
-from fastapi.testclient import TestClient
-from app import app
 
-
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI app"""
-    return TestClient(app)
-
-
-@pytest.fixture
-def reset_activities():
-    """Reset activities to initial state before each test"""
-    # Import app module to access activities
-    from app import activities
-    
-    # Store original state
-    original = {k: {"participants": list(v["participants"])} for k, v in activities.items()}
-    
-    yield
-    
-    # Restore original state
-    for activity_name, data in original.items():
-        activities[activity_name]["participants"] = data["participants"]
+@pytest_asyncio.fixture(scope="session")
+async def activities_response(client):
+    """Fetch GET /activities once and share the parsed body across tests"""
+    response = await client.get(ACTIVITIES_URL)
+    assert response.status_code == 200
+    return response.json()
 
 
 class TestGetActivities:
     """Tests for GET /activities endpoint"""
 
-    def test_get_activities_returns_all_activities(self, client):
+    async def test_get_activities_returns_all_activities(self, activities_response):
         """Test that GET /activities returns all activities"""
-        response = client.get("/activities")
-        assert response.status_code == 200
-        data = response.json()
+        data = activities_response
         assert isinstance(data, dict)
         assert len(data) > 0
         assert "Basketball" in data
         assert "Tennis Club" in data
 
-    def test_get_activities_contains_required_fields(self, client):
+    async def test_get_activities_contains_required_fields(self, activities_response):
         """Test that each activity contains required fields"""
-        response = client.get("/activities")
-        data = response.json()
+        data = activities_response
         
         for activity_name, activity_data in data.items():
             assert "description" in activity_data
@@ -60,10 +47,9 @@ class TestGetActivities:
             assert "participants" in activity_data
             assert isinstance(activity_data["participants"], list)
 
-    def test_get_activities_participants_are_strings(self, client):
+    async def test_get_activities_participants_are_strings(self, activities_response):
         """Test that participants in activities are email strings"""
-        response = client.get("/activities")
-        data = response.json()
+        data = activities_response
         
         for activity_name, activity_data in data.items():
             for participant in activity_data["participants"]:
@@ -74,142 +60,90 @@ class TestGetActivities:
 class TestSignupForActivity:
     """Tests for POST /activities/{activity_name}/signup endpoint"""
 
-    def test_signup_for_activity_success(self, client, reset_activities):
-        """Test successful signup for an activity"""
-        response = client.post(
-            "/activities/Basketball/signup?email=neustudent@mergington.edu"
-        )
-        assert response.status_code == 200
+    @pytest.mark.parametrize(
+        "path,status_code,expected",
+        [
+            (TENNIS_SIGNUP, 200, "for Tennis Club"),
+            (NONEXISTENT_SIGNUP, 404, "Activity not found"),
+            # registered_test_email is already signed up for Basketball
+            (BASKETBALL_SIGNUP, 400, "already signed up"),
+        ],
+    )
+    async def test_signup(self, client, registered_test_email, path,
+                          status_code, expected):
+        """Test signup responses for valid and invalid requests"""
+        response = await client.post(path, params={"email": registered_test_email})
+        assert response.status_code == status_code
         data = response.json()
-        assert "message" in data
-        assert "neustudent@mergington.edu" in data["message"]
-        assert "Basketball" in data["message"]
+        assert expected in data.get("message", data.get("detail"))
 
-    def test_signup_adds_participant_to_activity(self, client, reset_activities):
+    def test_signup_adds_participant_to_activity(self, test_email):
         """Test that signup actually adds the participant to the activity"""
-        from app import activities
-        
-        initial_count = len(activities["Basketball"]["participants"])
-        response = client.post(
-            "/activities/Basketball/signup?email=newperson@mergington.edu"
-        )
-        assert response.status_code == 200
-        assert len(activities["Basketball"]["participants"]) == initial_count + 1
-        assert "newperson@mergington.edu" in activities["Basketball"]["participants"]
-
-    def test_signup_for_nonexistent_activity_returns_404(self, client):
-        """Test that signup for non-existent activity returns 404"""
-        response = client.post(
-            "/activities/NonexistentClub/signup?email=student@mergington.edu"
-        )
-        assert response.status_code == 404
-        data = response.json()
-        assert "Activity not found" in data["detail"]
-
-    def test_signup_already_registered_returns_400(self, client, reset_activities):
-        """Test that signing up twice returns 400 error"""
-        email = "alex@mergington.edu"
-        
-        # First signup should succeed
-        response = client.post(
-            f"/activities/Basketball/signup?email={email}"
-        )
-        assert response.status_code == 400
-        data = response.json()
-        assert "already signed up" in data["detail"]
+        initial_count = app.state.participant_counts["Basketball"]
+        result = signup_for_activity("Basketball", test_email)
+        assert test_email in result["message"]
+        assert app.state.participant_counts["Basketball"] == initial_count + 1
+        assert test_email in activities["Basketball"]["participants"]
 
-    def test_signup_with_different_activities(self, client, reset_activities):
+    async def test_signup_with_different_activities(self, client, test_email):
         """Test signup for multiple different activities"""
-        email = "student@mergington.edu"
-        
-        response1 = client.post(
-            f"/activities/Basketball/signup?email={email}"
+        # Different activities, so the requests can be issued concurrently
+        response1, response2 = await asyncio.gather(
+            client.post(BASKETBALL_SIGNUP, params={"email": test_email}),
+            client.post(TENNIS_SIGNUP, params={"email": test_email}),
         )
         assert response1.status_code == 200
-        
-        response2 = client.post(
-            f"/activities/Tennis%20Club/signup?email={email}"
-        )
         assert response2.status_code == 200
 
 
 class TestUnregisterFromActivity:
     """Tests for POST /activities/{activity_name}/unregister endpoint"""
 
-    def test_unregister_from_activity_success(self, client, reset_activities):
-        """Test successful unregistration from an activity"""
-        from app import activities
-        
-        # Use an existing participant
-        email = activities["Basketball"]["participants"][0]
-        
-        response = client.post(
-            f"/activities/Basketball/unregister?email={email}"
-        )
-        assert response.status_code == 200
+    @pytest.mark.parametrize(
+        "path,status_code,expected",
+        [
+            (BASKETBALL_UNREGISTER, 200, "from Basketball"),
+            (NONEXISTENT_UNREGISTER, 404, "Activity not found"),
+            # registered_test_email only signs up for Basketball
+            (TENNIS_UNREGISTER, 400, "not signed up"),
+        ],
+    )
+    async def test_unregister(self, client, registered_test_email, path,
+                              status_code, expected):
+        """Test unregister responses for valid and invalid requests"""
+        response = await client.post(path, params={"email": registered_test_email})
+        assert response.status_code == status_code
         data = response.json()
-        assert "message" in data
-        assert "Unregistered" in data["message"]
+        assert expected in data.get("message", data.get("detail"))
 
-    def test_unregister_removes_participant(self, client, reset_activities):
+    def test_unregister_removes_participant(self, registered_test_email):
         """Test that unregister actually removes the participant"""
-        from app import activities
-        
-        email = activities["Basketball"]["participants"][0]
-        initial_count = len(activities["Basketball"]["participants"])
-        
-        response = client.post(
-            f"/activities/Basketball/unregister?email={email}"
-        )
-        assert response.status_code == 200
-        assert len(activities["Basketball"]["participants"]) == initial_count - 1
-        assert email not in activities["Basketball"]["participants"]
-
-    def test_unregister_nonexistent_activity_returns_404(self, client):
-        """Test that unregistering from non-existent activity returns 404"""
-        response = client.post(
-            "/activities/NonexistentClub/unregister?email=student@mergington.edu"
-        )
-        assert response.status_code == 404
-        data = response.json()
-        assert "Activity not found" in data["detail"]
+        initial_count = app.state.participant_counts["Basketball"]
 
-    def test_unregister_not_signed_up_returns_400(self, client, reset_activities):
-        """Test that unregistering when not signed up returns 400"""
-        response = client.post(
-            "/activities/Basketball/unregister?email=notsignedupstudent@mergington.edu"
-        )
-        assert response.status_code == 400
-        data = response.json()
-        assert "not signed up" in data["detail"]
+        result = unregister_from_activity("Basketball", registered_test_email)
+        assert registered_test_email in result["message"]
+        assert app.state.participant_counts["Basketball"] == initial_count - 1
+        assert registered_test_email not in activities["Basketball"]["participants"]
 
-    def test_signup_then_unregister_cycle(self, client, reset_activities):
+    def test_signup_then_unregister_cycle(self, test_email):
         """Test signup followed by unregister"""
-        from app import activities
-        
-        email = "cyclestudent@mergington.edu"
-        initial_count = len(activities["Tennis Club"]["participants"])
-        
+        initial_count = app.state.participant_counts["Tennis Club"]
+
         # Sign up
-        response1 = client.post(
-            f"/activities/Tennis%20Club/signup?email={email}"
-        )
-        assert response1.status_code == 200
-        assert len(activities["Tennis Club"]["participants"]) == initial_count + 1
-        
+        signup_for_activity("Tennis Club", test_email)
+        assert app.state.participant_counts["Tennis Club"] == initial_count + 1
+
         # Unregister
-        response2 = client.post(
-            f"/activities/Tennis%20Club/unregister?email={email}"
-        )
-        assert response2.status_code == 200
-        assert len(activities["Tennis Club"]["participants"]) == initial_count
+        unregister_from_activity("Tennis Club", test_email)
+        assert app.state.participant_counts["Tennis Club"] == initial_count
 
 
 class TestRootEndpoint:
     """Tests for GET / endpoint"""
 
-    def test_root_redirects_to_static_index(self, client):
+    def test_root_redirects_to_static_index(self):
         """Test that root endpoint redirects to static index.html"""
-        response = client.get("/", follow_redirects=False)
+        route = next(r for r in app.routes if getattr(r, "path", None) == "/")
+        response = route.endpoint()
         assert response.status_code == 307
         assert response.headers["location"] == "/static/index.html"